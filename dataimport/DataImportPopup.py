@@ -1,10 +1,211 @@
+import os
 import pandas as pd
-import re
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pyreadstat
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from tkinter import filedialog, StringVar, IntVar, Toplevel, LabelFrame
+from tkinter import filedialog, StringVar, IntVar, Toplevel, LabelFrame, Listbox
 from ttkbootstrap.tableview import Tableview
 
+# Number of rows that are read to preview the data. The full data set is only read
+# once the user imports it.
+PREVIEW_ROWS = 200
+# Number of preview rows that are added to the tableview at once. The window is
+# redrawn between batches, so the first page is shown before all rows are added.
+PREVIEW_BATCH_SIZE = 50
+
+# Separators that the user can select for csv files
+SEPARATOR_OPTIONS = {",": ",", ";": ";", "Space": " ", "Tab": "\t"}
+SEPARATOR_KEYS = tuple(SEPARATOR_OPTIONS)
+
+# Size of the read buffer when csv files are parsed with the C engine (1 MiB)
+CSV_BUFFER_SIZE = 1024 * 1024
+
+
+def _read_csv_c(filepath: str, **kwargs) -> pd.DataFrame:
+    """Reads a csv file with the C engine of pandas. The file is read through a large buffer, which reduces the number of read calls for wide files.
+
+    Args:
+        filepath (str): path to the csv file
+        **kwargs: further arguments passed to pd.read_csv
+
+    Returns:
+        pd.DataFrame: the data set
+    """
+    with open(filepath, "rb", buffering=CSV_BUFFER_SIZE) as file:
+        return pd.read_csv(file, engine="c", low_memory=False, **kwargs)
+
+
+def _read_data(
+    filepath: str,
+    options: dict,
+    nrows: int | None = None,
+    excel_file: pd.ExcelFile | None = None,
+) -> pd.DataFrame:
+    """Reads a data file. This function is run on the worker thread of the DataImportPopup and must not access any tkinter objects.
+
+    Args:
+        filepath (str): path to the data file
+        options (dict): import options for the specific file type (e.g., separator, missing values encoding)
+        nrows (int | None, optional): maximal number of rows to read. If None, the full file is read. Defaults to None.
+        excel_file (pd.ExcelFile | None, optional): opened excel file; used instead of the path for xlsx files. Defaults to None.
+
+    Returns:
+        pd.DataFrame: the data set
+    """
+    # Previews are stored in Arrow-backed columns, which avoids allocating one Python
+    # object per string cell. Full reads keep the default numpy dtypes.
+    if filepath.endswith(".csv"):
+        if nrows is not None:
+            # the pyarrow engine does not support reading only the first rows
+            return _read_csv_c(
+                filepath, nrows=nrows, dtype_backend="pyarrow", **options
+            )
+        # the pyarrow engine parses in parallel, but does not support every
+        # file the C engine can handle; fall back to the C engine in that case
+        try:
+            df = pd.read_csv(filepath, engine="pyarrow", **options)
+        except ValueError:
+            return _read_csv_c(filepath, **options)
+        # pyarrow keeps empty and duplicated header names as they are; use the
+        # column names of the C engine (e.g., "Unnamed: 0") shown in the preview
+        header = _read_csv_c(filepath, nrows=0, **options)
+        if len(header.columns) == df.shape[1]:
+            df.columns = header.columns
+        # Unlike the C engine, pyarrow parses ISO dates, times and timestamps. These
+        # columns are read again with the C engine, so that they stay text as in the
+        # preview (and as before the switch to pyarrow)
+        positions = [
+            i
+            for i in range(df.shape[1])
+            if pd.api.types.infer_dtype(df.iloc[:, i], skipna=True)
+            in ("date", "time", "datetime", "datetime64")
+        ]
+        if len(positions) > 0:
+            text = _read_csv_c(filepath, usecols=positions, **options)
+            for i, column in zip(positions, text.columns):
+                df.isetitem(i, text[column])
+        return df
+    elif filepath.endswith(".xlsx"):
+        source = excel_file if excel_file is not None else filepath
+        if nrows is not None:
+            return pd.read_excel(
+                source, nrows=nrows, dtype_backend="pyarrow", **options
+            )
+        return pd.read_excel(source, **options)
+    elif filepath.endswith(".sav"):
+        if nrows is not None:
+            # the preview skips the datetime conversion and value labels, which
+            # require a pass over every column
+            df, metadata = pyreadstat.read_sav(
+                filepath,
+                row_limit=nrows,
+                disable_datetime_conversion=True,
+                apply_value_formats=False,
+            )
+            # keep the metadata (e.g., labels) in the same place as pd.read_spss
+            df.attrs = metadata.__dict__
+            return df
+        return pd.read_spss(filepath)
+    elif filepath.endswith(".parquet"):
+        if nrows is not None:
+            # only decode the first rows of the selected columns
+            with pq.ParquetFile(filepath) as parquet_file:
+                batch = next(
+                    parquet_file.iter_batches(batch_size=nrows, **options), None
+                )
+                if batch is None:
+                    table = parquet_file.schema_arrow.empty_table()
+                    if options["columns"] is not None:
+                        table = table.select(options["columns"])
+                else:
+                    table = pa.Table.from_batches([batch])
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        # the columns are stored as a tuple to keep the options hashable, but pyarrow
+        # expects a list
+        columns = options["columns"]
+        return pd.read_parquet(
+            filepath,
+            engine="pyarrow",
+            columns=list(columns) if columns is not None else None,
+        )
+    elif filepath.endswith(".feather"):
+        if nrows is not None:
+            table = _read_feather_head(filepath, nrows=nrows, **options)
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        columns = options["columns"]
+        return pd.read_feather(
+            filepath, columns=list(columns) if columns is not None else None
+        )
+    raise ValueError(f"Unsupported file type: {filepath}")
+
+
+def _read_feather_head(
+    filepath: str, nrows: int, columns: tuple[str, ...] | None = None
+) -> pa.Table:
+    """Reads the first rows of a feather file. Only the record batches that contain these rows are read and decompressed.
+
+    Args:
+        filepath (str): path to the feather file
+        nrows (int): maximal number of rows to read
+        columns (tuple[str, ...] | None, optional): columns to read. If None, all columns are read. Defaults to None.
+
+    Returns:
+        pa.Table: the first rows of the file
+    """
+    try:
+        reader = pa.ipc.open_file(filepath)
+    except pa.ArrowInvalid:
+        # Feather V1 files are not Arrow IPC files. They are never compressed, so
+        # the memory mapped read only touches the rows that are sliced
+        table = feather.read_table(filepath, columns=columns, memory_map=True)
+        return table.slice(0, nrows)
+    with reader:
+        batches = []
+        n_read = 0
+        for i in range(reader.num_record_batches):
+            if n_read >= nrows:
+                break
+            batch = reader.get_batch(i)
+            batches.append(batch)
+            n_read += batch.num_rows
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    if columns is not None:
+        table = table.select(columns)
+    return table.slice(0, nrows)
+
+
+def _read_column_names(filepath: str) -> list[str]:
+    """Reads the column names from the schema of a parquet or feather file without reading the data. Index columns written by pandas are left out.
+
+    Args:
+        filepath (str): path to the parquet or feather file
+
+    Returns:
+        list[str]: column names
+    """
+    if filepath.endswith(".parquet"):
+        schema = pq.read_schema(filepath)
+    else:
+        try:
+            with pa.ipc.open_file(filepath) as reader:
+                schema = reader.schema
+        except pa.ArrowInvalid:
+            # Feather V1 files are not Arrow IPC files; they are never compressed, so
+            # the memory mapped read does not load the data
+            schema = feather.read_table(filepath, memory_map=True).schema
+    # pandas stores the index of a data frame as extra columns; these are restored
+    # as index when reading and can not be selected as data columns
+    index_columns = []
+    if schema.pandas_metadata is not None:
+        index_columns = schema.pandas_metadata.get("index_columns", [])
+    return [name for name in schema.names if name not in index_columns]
+
 
 def import_data(root: ttk.Window) -> pd.DataFrame | None:
     """Import data is the main interface for using DataImportPopup. It creates a popup window that allows the user to select a file and import it into a pandas DataFrame.
@@ -33,12 +234,11 @@ class CSVOptionsFrame(ttk.Frame):
         separator_label = ttk.Label(self, text="Separator (CSV only):")
         separator_label.pack(pady=5)
 
-        self.separator_options = {",": ",", ";": ";", "Space": " ", "Tab": "\t"}
         self.separator_var = StringVar(value=",")
         self.separator_dropdown = ttk.Combobox(
             self,
             textvariable=self.separator_var,
-            values=list(self.separator_options.keys()),
+            values=SEPARATOR_KEYS,
         )
         self.separator_dropdown.pack(pady=5)
 
@@ -58,17 +258,17 @@ class CSVOptionsFrame(ttk.Frame):
         Returns:
             str: separator selected by the user
         """
-        return self.separator_options[self.separator_var.get()]
+        return SEPARATOR_OPTIONS[self.separator_var.get()]
 
-    def get_na_value(self) -> str:
-        """Return the user selected NA value (e.g., -999, NaN) for the csv file.
+    def get_na_value(self) -> list[str]:
+        """Return the user selected NA values (e.g., -999, NaN) for the csv file.
 
         Returns:
-            str: The NA value selected by the user
+            list[str]: The NA values selected by the user and the empty string (blank fields stay missing); empty if pandas' default NA values should be used
         """
         if self.missing_values_var.get() == "Default":
-            return None
-        return self.missing_values_var.get()
+            return []
+        return [self.missing_values_var.get(), ""]
 
 
 class ExcelOptionsFrame(ttk.Frame):
@@ -122,15 +322,15 @@ class ExcelOptionsFrame(ttk.Frame):
         """
         return self.skiprows_var.get()
 
-    def get_na_value(self) -> str:
+    def get_na_value(self) -> list[str]:
         """The missing values encoding that the user selected.
 
         Returns:
-            str: missing values encoding
+            list[str]: missing values encoding and the empty string (empty cells stay missing); empty if pandas' default NA values should be used
         """
         if self.missing_values_var.get() == "Default":
-            return None
-        return self.missing_values_var.get()
+            return []
+        return [self.missing_values_var.get(), ""]
 
 
 class SPSSOptionsFrame(ttk.Frame):
@@ -143,6 +343,42 @@ class SPSSOptionsFrame(ttk.Frame):
         super().__init__(parent, *args, **kwargs)
 
 
+class ParquetOptionsFrame(ttk.Frame):
+    def __init__(self, parent: ttk.Frame, column_names: list[str], *args, **kwargs):
+        """Initialize a frame for Parquet and Feather import options. This will allow the user to select the columns that should be imported.
+
+        Args:
+            parent (ttk.Frame): parent frame
+            column_names (list[str]): the names of the columns in the file
+        """
+        super().__init__(parent, *args, **kwargs)
+
+        # Column selector
+        columns_label = ttk.Label(self, text="Columns (none selected = all):")
+        columns_label.pack(pady=5)
+
+        self.column_names = column_names
+        self.columns_listbox = Listbox(
+            self,
+            selectmode=MULTIPLE,
+            exportselection=False,
+            height=min(len(column_names), 10),
+        )
+        self.columns_listbox.insert(END, *column_names)
+        self.columns_listbox.pack(pady=5)
+
+    def get_columns(self) -> tuple[str, ...] | None:
+        """Returns the columns that the user selected.
+
+        Returns:
+            tuple[str, ...] | None: selected columns or None if all columns should be imported
+        """
+        selection = self.columns_listbox.curselection()
+        if len(selection) == 0:
+            return None
+        return tuple(self.column_names[i] for i in selection)
+
+
 class DataImportPopup(Toplevel):
     def __init__(self, root: ttk.Window):
         """Initialize the DataImportPopup window. This window allows the user to select a file and import it into a pandas DataFrame.
@@ -155,6 +391,7 @@ class DataImportPopup(Toplevel):
         self.title("Select Dataset")
 
         self.data_frame = None
+        self.filepath = None
 
         self.left_frame = ttk.Frame(self)
         self.left_frame.pack(side=LEFT, padx=10, pady=10, fill=Y)
@@ -174,25 +411,91 @@ class DataImportPopup(Toplevel):
         )
         self.show_preview_selection.pack(pady=5)
 
+        # Progress bar that is shown while a file is read
+        self.progressbar = ttk.Progressbar(self.left_frame, mode="indeterminate")
+
         # Placeholder for specifications of how to import the file
         self.import_options_frame = None
+        self.import_options_container = ttk.Frame(self.left_frame)
+        self.import_options_container.pack(fill=X)
+
+        # Import button; only shown once a preview of the selected file was loaded
+        self.import_btn = ttk.Button(
+            self.left_frame,
+            text="Import",
+            command=self.__import_data,
+        )
 
         # Frame for the right side (Table preview)
         self.right_frame = LabelFrame(self, text="Data Preview")
         self.right_frame.pack(side=RIGHT, padx=10, pady=10, fill=BOTH, expand=True)
 
-        # Tableview for data preview
+        # Tableview for data preview. The columns are fitted once after the first
+        # batch of rows is added (see __append_preview_rows)
         self.preview_tableview = Tableview(
             self.right_frame,
             paginated=True,
             pagesize=25,
-            autofit=True,
+            searchable=False,
+            autofit=False,
             coldata=[],
             rowdata=[],
         )
         self.preview_tableview.pack(fill=BOTH, expand=True)
 
-        self.import_btn = None
+        self.refresh_btn = None
+
+        # Opened excel file; kept so that the workbook is only parsed once per file.
+        # It is opened again when the modification time of the file changes
+        self.excel_file = None
+        self.excel_file_mtime_ns = None
+
+        # Files are read on a worker thread to keep the window responsive
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.poll_job = None
+        # Pending job that adds the next batch of rows to the preview
+        self.append_job = None
+        # Cache of the last previews, keyed by file path, modification time, import
+        # options and number of rows. It lives as long as the window
+        self.preview_cache = lru_cache(maxsize=4)(self.__read_preview_uncached)
+
+    def destroy(self) -> None:
+        """Stop waiting for running reads, close the opened excel file (if any), drop the cached previews and destroy the window."""
+        if self.poll_job is not None:
+            self.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.__cancel_append_job()
+        self.__close_excel_file()
+        self.preview_cache.cache_clear()
+        self.executor.shutdown(wait=False)
+        super().destroy()
+
+    def __close_excel_file(self) -> None:
+        """Close the cached excel file. Closing is queued on the worker thread so that it never interferes with a running read."""
+        if self.excel_file is not None:
+            self.executor.submit(self.excel_file.close)
+            self.excel_file = None
+
+    def __open_excel_file(self) -> bool:
+        """Opens the selected excel file, unless it is already open and has not changed on disk since.
+
+        Returns:
+            bool: True if the excel file is open, False if it could not be opened
+        """
+        try:
+            mtime_ns = os.stat(self.filepath).st_mtime_ns
+            if self.excel_file is not None and self.excel_file_mtime_ns == mtime_ns:
+                return True
+            self.__close_excel_file()
+            self.excel_file = pd.ExcelFile(self.filepath, engine="calamine")
+            self.excel_file_mtime_ns = mtime_ns
+        except Exception as e:
+            ttk.dialogs.dialogs.Messagebox.show_error(
+                "The selected excel file could not be opened.",
+                parent=self,
+            )
+            return False
+        return True
 
     def show(self) -> dict[str, pd.DataFrame | str | None]:
         """show the actual window. This function mainly ensures that other windows are waiting for the data import window to close and return the data.
@@ -204,13 +507,11 @@ class DataImportPopup(Toplevel):
         self.deiconify()
         self.wm_protocol("WM_DELETE_WINDOW", self.destroy)
         self.wait_window(self)
-        # try to get the name of the file
-        try:
-            # https://stackoverflow.com/questions/9363145/regex-for-extracting-filename-from-path
-            filename = re.search("[ \w-]+?(?=\.)", self.filepath).group(0)
-        except:
+        # get the name of the file without directory and extension
+        if self.filepath is not None:
+            filename = os.path.splitext(os.path.basename(self.filepath))[0]
+        else:
             filename = None
-        print(filename)
         return {"data_frame": self.data_frame, "data_name": filename}
 
     def __select_file(self) -> None:
@@ -220,6 +521,8 @@ class DataImportPopup(Toplevel):
             ("CSV files", "*.csv"),
             ("Excel files", "*.xlsx"),
             ("SPSS files", "*.sav"),
+            ("Parquet files", "*.parquet"),
+            ("Feather files", "*.feather"),
             ("All files", "*.*"),
         )
         current_filepath = filedialog.askopenfilename(
@@ -231,105 +534,300 @@ class DataImportPopup(Toplevel):
             return
         else:
             self.filepath = current_filepath
+            self.__close_excel_file()
 
         # show the options for this file type
         if self.import_options_frame is not None:
-            self.import_options_frame.forget()
+            self.import_options_frame.destroy()
+            self.import_options_frame = None
+            self.refresh_btn = None
+        self.import_btn.pack_forget()
         if self.filepath.endswith(".csv"):
-            self.import_options_frame = CSVOptionsFrame(self.left_frame)
+            self.import_options_frame = CSVOptionsFrame(self.import_options_container)
             self.import_options_frame.pack(pady=5)
             # Refresh button with a refresh symbol
-            refresh_btn = ttk.Button(
+            self.refresh_btn = ttk.Button(
                 self.import_options_frame,
                 text="Refresh Preview ⟳",
                 command=self.__import_preview_data,
             )
-            refresh_btn.pack(pady=5)
+            self.refresh_btn.pack(pady=5)
         elif self.filepath.endswith(".xlsx"):
+            if not self.__open_excel_file():
+                return
             self.import_options_frame = ExcelOptionsFrame(
-                self.left_frame, sheet_names=pd.ExcelFile(self.filepath).sheet_names
+                self.import_options_container, sheet_names=self.excel_file.sheet_names
             )
             self.import_options_frame.pack(pady=5)
             # Refresh button with a refresh symbol
-            refresh_btn = ttk.Button(
+            self.refresh_btn = ttk.Button(
                 self.import_options_frame,
                 text="Refresh Preview ⟳",
                 command=self.__import_preview_data,
             )
-            refresh_btn.pack(pady=5)
+            self.refresh_btn.pack(pady=5)
         elif self.filepath.endswith(".sav"):
-            self.import_options_frame = SPSSOptionsFrame(self.left_frame)
+            self.import_options_frame = SPSSOptionsFrame(self.import_options_container)
             self.import_options_frame.pack(pady=5)
+        elif self.filepath.endswith((".parquet", ".feather")):
+            try:
+                column_names = _read_column_names(self.filepath)
+            except Exception as e:
+                ttk.dialogs.dialogs.Messagebox.show_error(
+                    "The selected file could not be opened.",
+                    parent=self,
+                )
+                return
+            self.import_options_frame = ParquetOptionsFrame(
+                self.import_options_container, column_names=column_names
+            )
+            self.import_options_frame.pack(pady=5)
+            # Refresh button with a refresh symbol
+            self.refresh_btn = ttk.Button(
+                self.import_options_frame,
+                text="Refresh Preview ⟳",
+                command=self.__import_preview_data,
+            )
+            self.refresh_btn.pack(pady=5)
         else:
             ttk.dialogs.dialogs.Messagebox.show_error(
-                "Selected file must be one of the following file types: csv, xlsx, .sav.",
+                "Selected file must be one of the following file types: csv, xlsx, .sav, .parquet, .feather.",
                 parent=self,
             )
             return
 
         self.__import_preview_data()
 
-    def __import_preview_data(self) -> None:
-        """Imports the data with the selected import options for the specific data file and shows a preview in the tableview."""
-        # Load the selected file based on type and separator
+    def __get_read_options(self) -> dict | None:
+        """Collects the import options that the user selected for the specific data file.
+
+        Returns:
+            dict | None: keyword arguments for the reader or None if the options are invalid
+        """
         if self.filepath.endswith(".csv"):
             try:
-                df = pd.read_csv(
-                    self.filepath,
-                    sep=self.import_options_frame.get_separator(),
-                    na_values=self.import_options_frame.get_na_value(),
+                separator = self.import_options_frame.get_separator()
+            except KeyError as e:
+                ttk.dialogs.dialogs.Messagebox.show_error(
+                    "Separator must be one of: " + ", ".join(SEPARATOR_KEYS) + "."
                 )
-            except Exception as e:
-                return
+                return None
+            na_values = self.import_options_frame.get_na_value()
+            # a custom NA value replaces pandas' default NA values, so that the
+            # parser only has to check one set of NA values per cell
+            return {
+                "sep": separator,
+                "na_values": tuple(na_values),
+                "keep_default_na": len(na_values) == 0,
+            }
         elif self.filepath.endswith(".xlsx"):
             try:
-                try:
-                    self.import_options_frame.get_skiprows()
-                except Exception as e:
-                    ttk.dialogs.dialogs.Messagebox.show_error(
-                        "Skip rows must be a number."
-                    )
-                    return
-                df = pd.read_excel(
-                    self.filepath,
-                    sheet_name=self.import_options_frame.get_sheet_name(),
-                    skiprows=self.import_options_frame.get_skiprows(),
-                    na_values=self.import_options_frame.get_na_value(),
-                )
+                skiprows = self.import_options_frame.get_skiprows()
             except Exception as e:
-                return
+                ttk.dialogs.dialogs.Messagebox.show_error("Skip rows must be a number.")
+                return None
+            na_values = self.import_options_frame.get_na_value()
+            return {
+                "sheet_name": self.import_options_frame.get_sheet_name(),
+                "skiprows": skiprows,
+                "na_values": tuple(na_values),
+                "keep_default_na": len(na_values) == 0,
+            }
         elif self.filepath.endswith(".sav"):
+            return {}
+        elif self.filepath.endswith((".parquet", ".feather")):
+            return {"columns": self.import_options_frame.get_columns()}
+        return None
+
+    def __submit_read(
+        self, nrows: int | None, on_done: Callable[[pd.DataFrame | None], None]
+    ) -> None:
+        """Reads the selected file on the worker thread and passes the data to on_done once the read has finished.
+
+        Args:
+            nrows (int | None): maximal number of rows to read. If None, the full file is read.
+            on_done (Callable[[pd.DataFrame | None], None]): called with the data set or None if the file could not be read
+        """
+        options = self.__get_read_options()
+        if options is None:
+            return
+        # reopen the workbook if it was saved since it was opened
+        if self.filepath.endswith(".xlsx") and not self.__open_excel_file():
+            return
+        if nrows is None:
+            # only previews are cached; the full data set is read once when importing
+            future = self.executor.submit(
+                _read_data, self.filepath, options, nrows, self.excel_file
+            )
+        else:
             try:
-                df = pd.read_spss(self.filepath)
-            except Exception as e:
+                if self.filepath.endswith(".xlsx"):
+                    # the workbook is reopened whenever the file changes, so its
+                    # modification time identifies the data that is read from it
+                    mtime_ns = self.excel_file_mtime_ns
+                else:
+                    mtime_ns = os.stat(self.filepath).st_mtime_ns
+            except OSError as e:
+                on_done(None)
                 return
+            future = self.executor.submit(
+                self.__read_preview_data, self.filepath, mtime_ns, options, nrows
+            )
+        self.__set_busy(True)
+        self.poll_job = self.after(50, self.__poll_read, future, on_done)
+
+    def __read_preview_data(
+        self, filepath: str, mtime_ns: int, options: dict, nrows: int
+    ) -> pd.DataFrame:
+        """Reads the first rows of a data file for the preview. Previews are cached, so that refreshing the preview with unchanged options does not read the file again. Runs on the worker thread.
+
+        Args:
+            filepath (str): path to the data file
+            mtime_ns (int): modification time of the data file in nanoseconds
+            options (dict): import options for the specific file type (e.g., separator, missing values encoding)
+            nrows (int): maximal number of rows to read
+
+        Returns:
+            pd.DataFrame: the first rows of the data set
+        """
+        df = self.preview_cache(filepath, mtime_ns, tuple(options.items()), nrows)
+        # shallow copy, so that adding, removing or renaming columns of the returned
+        # data set does not alter the cache; the values are still shared with it
+        return df.copy(deep=False)
+
+    def __read_preview_uncached(
+        self, filepath: str, mtime_ns: int, options: tuple, nrows: int
+    ) -> pd.DataFrame:
+        """Reads the first rows of a data file; called by the preview cache if the preview is not cached yet. The modification time is only part of the cache key, so that changes to the file are picked up.
+
+        Args:
+            filepath (str): path to the data file
+            mtime_ns (int): modification time of the data file in nanoseconds
+            options (tuple): import options as a tuple of (key, value) pairs
+            nrows (int): maximal number of rows to read
+
+        Returns:
+            pd.DataFrame: the first rows of the data set
+        """
+        return _read_data(filepath, dict(options), nrows, self.excel_file)
+
+    def __poll_read(
+        self, future: Future, on_done: Callable[[pd.DataFrame | None], None]
+    ) -> None:
+        """Checks if the read has finished; if so, passes the result to on_done.
+
+        Args:
+            future (Future): the running read
+            on_done (Callable[[pd.DataFrame | None], None]): called with the data set or None if the file could not be read
+        """
+        if not future.done():
+            self.poll_job = self.after(50, self.__poll_read, future, on_done)
+            return
+        self.poll_job = None
+        self.__set_busy(False)
+        try:
+            df = future.result()
+        except Exception as e:
+            df = None
+        on_done(df)
+
+    def __set_busy(self, busy: bool) -> None:
+        """Shows the progress bar and disables the buttons while a file is read.
+
+        Args:
+            busy (bool): True if a read is running
+        """
+        state = DISABLED if busy else NORMAL
+        for button in (self.select_file_btn, self.refresh_btn, self.import_btn):
+            if button is not None:
+                button.configure(state=state)
+        if busy:
+            self.progressbar.pack(pady=5, fill=X)
+            self.progressbar.start()
         else:
+            self.progressbar.stop()
+            self.progressbar.pack_forget()
+
+    def __import_preview_data(self) -> None:
+        """Imports the first rows of the data with the selected import options for the specific data file and shows a preview in the tableview."""
+        self.__submit_read(nrows=PREVIEW_ROWS, on_done=self.__show_preview_data)
+
+    def __show_preview_data(self, df: pd.DataFrame | None) -> None:
+        """Shows the preview of the data in the tableview.
+
+        Args:
+            df (pd.DataFrame | None): first rows of the data set or None if the file could not be read
+        """
+        if df is None:
             return
 
         # Update Tableview with the imported data
+        self.__cancel_append_job()
         if self.show_preview.get() == 1:
-            coldata = list(df.columns)
-            rowdata = df.values.tolist()
+            # to_dict converts the values column by column in pandas and
+            # returns missing values of Arrow-backed columns as None
+            split = df.head(PREVIEW_ROWS).to_dict(orient="split", index=False)
+            coldata = split["columns"]
+            rowdata = split["data"]
             self.preview_tableview.build_table_data(
                 coldata=coldata,
-                rowdata=rowdata,
+                rowdata=[],
             )
+            self.__append_preview_rows(rowdata=rowdata, start=0)
         else:
             self.preview_tableview.build_table_data(
                 coldata=[],
                 rowdata=[],
             )
 
-        # add import button
-        if self.import_btn is not None:
-            self.import_btn.forget()
+        # show import button
+        if not self.import_btn.winfo_manager():
+            self.import_btn.pack(pady=20)
 
-        self.import_btn = ttk.Button(
-            self.import_options_frame,
-            text="Import",
-            command=lambda data=df: self.__return_data(data_frame=data),
-        )
-        self.import_btn.pack(pady=20)
+    def __append_preview_rows(self, rowdata: list[list], start: int) -> None:
+        """Adds the next batch of rows to the preview and schedules the following batch once the window is idle.
+
+        Args:
+            rowdata (list[list]): all rows of the preview
+            start (int): index of the first row of the batch
+        """
+        end = start + PREVIEW_BATCH_SIZE
+        # Tableview.insert_rows reverses the rows when appending, so we insert them one by one
+        for values in rowdata[start:end]:
+            self.preview_tableview.insert_row(END, values)
+        self.preview_tableview.load_table_data()
+        if start == 0:
+            # the table was built without rows, so fitting and aligning the columns
+            # in build_table_data had no data to work with
+            self.preview_tableview.autofit_columns()
+            self.preview_tableview.autoalign_columns()
+        if end < len(rowdata):
+            self.append_job = self.after_idle(self.__append_preview_rows, rowdata, end)
+        else:
+            self.append_job = None
+
+    def __cancel_append_job(self) -> None:
+        """Stops adding rows to the preview."""
+        if self.append_job is not None:
+            self.after_cancel(self.append_job)
+            self.append_job = None
+
+    def __import_data(self) -> None:
+        """Imports the full data set with the selected import options and returns it to the main window."""
+        self.__submit_read(nrows=None, on_done=self.__on_import_done)
+
+    def __on_import_done(self, df: pd.DataFrame | None) -> None:
+        """Returns the fully imported data set to the main window.
+
+        Args:
+            df (pd.DataFrame | None): imported data set or None if the file could not be read
+        """
+        if df is None:
+            ttk.dialogs.dialogs.Messagebox.show_error(
+                "The selected file could not be imported.", parent=self
+            )
+            return
+        self.__return_data(data_frame=df)
 
     def __return_data(self, data_frame: pd.DataFrame) -> None:
         """destroy the window and return the data to the main window.